@@ -0,0 +1,66 @@
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Tuple
+from flask import current_app, request
+
+# In-process response cache for read endpoints.
+# Versions and bodies live in module globals, so this is only correct when a
+# single process serves every request (as with `app.run`). Under multiple
+# workers (e.g. gunicorn -w N) a write in one process never invalidates the
+# others, which keep serving stale bodies and answering 304 to stale ETags.
+# Each resource has a version counter that write routes bump after a
+# successful commit. GET handlers read the version *before* querying, so a
+# cached body is only ever served for the version it was built under.
+
+MAX_ENTRIES = 128
+
+QueryKey = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+_versions: Dict[str, int] = {}
+# (resource, sorted query args) -> (version, etag, body)
+_entries: Dict[Tuple[str, QueryKey], Tuple[int, str, str]] = {}
+
+
+def bump(*resources: str) -> None:
+    """Invalidate cached responses for the given resources."""
+    with _lock:
+        for resource in resources:
+            _versions[resource] = _versions.get(resource, 0) + 1
+            for key in [k for k in _entries if k[0] == resource]:
+                del _entries[key]
+
+
+def cached_json(resource: str, build: Callable[[], Any]):
+    """Return a JSON response for the current request, honouring If-None-Match.
+
+    `build` is only called when no body is cached for the resource's current
+    version and query string.
+    """
+    key = (resource, _query_key())
+    with _lock:
+        version = _versions.get(resource, 0)
+        entry = _entries.get(key)
+
+    if entry and entry[0] == version:
+        _, etag, body = entry
+    else:
+        body = f"{current_app.json.dumps(build())}\n"
+        etag = hashlib.sha1(body.encode("utf-8")).hexdigest()
+        with _lock:
+            # Skip storing if a write landed while we were building
+            if _versions.get(resource, 0) == version:
+                if key not in _entries and len(_entries) >= MAX_ENTRIES:
+                    _entries.pop(next(iter(_entries)))
+                _entries[key] = (version, etag, body)
+
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    # Let browsers keep the body but always revalidate with the ETag
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _query_key() -> QueryKey:
+    # Order-insensitive so ?a=1&b=2 and ?b=2&a=1 share an entry
+    return tuple(sorted(request.args.items(multi=True)))
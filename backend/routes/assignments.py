@@ -1,5 +1,6 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
 from database import db
+from cache import bump, cached_json
 from models import Assignment, Submission, Judge
 
 bp = Blueprint("assignments", __name__, url_prefix="/assignments")
@@ -37,6 +38,7 @@ def upsert_assignment():
         )
         db.session.add(assignment)
         db.session.commit()
+        bump("assignments")
         return {"ok": True, "id": assignment.id}
     except Exception as e:
         db.session.rollback()
@@ -45,11 +47,10 @@ def upsert_assignment():
 
 @bp.get("")
 def list_assignments():
-    rows = Assignment.query.all()
-    return jsonify([
+    return cached_json("assignments", lambda: [
         {"id": r.id, "submissionId": r.submission_id,
             "questionId": r.question_id, "judgeId": r.judge_id}
-        for r in rows
+        for r in Assignment.query.all()
     ])
 
 
@@ -60,6 +61,7 @@ def clear_all_assignments():
         count = Assignment.query.count()
         Assignment.query.delete()
         db.session.commit()
+        bump("assignments")
         return {"status": "ok", "deleted": count}
     except Exception as e:
         db.session.rollback()
@@ -1,5 +1,6 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
 from database import db
+from cache import bump, cached_json
 from models import Submission, Judge, Assignment, Evaluation
 from llm import evaluate
 
@@ -13,6 +14,7 @@ def clear_all_evaluations():
         count = Evaluation.query.count()
         Evaluation.query.delete()
         db.session.commit()
+        bump("evaluations")
         return {"status": "ok", "deleted": count}
     except Exception as e:
         db.session.rollback()
@@ -92,6 +94,7 @@ def run():
                     )
                     db.session.add(evaluation)
                     db.session.commit()
+                    bump("evaluations")
                     stats["completed"] += 1
                 except Exception as e:
                     db.session.rollback()
@@ -109,6 +112,11 @@ def run():
 
 @bp.get("")
 def list_evals():
+    # Cached per filter combination; see cache.cached_json
+    return cached_json("evaluations", _build_eval_list)
+
+
+def _build_eval_list():
     # Build query with optional filters
     query = Evaluation.query
 
@@ -126,7 +134,7 @@ def list_evals():
     passed = sum(1 for e in evaluations if e.verdict == "pass")
     pass_rate = round((passed / total) * 100, 2) if total else 0
 
-    return jsonify({
+    return {
         "summary": {
             "total": total,
             "pass": passed,
@@ -141,4 +149,4 @@ def list_evals():
             "reasoning": e.reasoning,
             "createdAt": e.created_at.isoformat(),
         } for e in evaluations]
-    })
+    }
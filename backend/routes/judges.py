@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from database import db
+from cache import bump, cached_json
 from models import Judge
 from llm import get_valid_models, VALID_OPENAI_MODELS
 
@@ -14,15 +15,14 @@ def list_models():
 
 @bp.get("")
 def list_judges():
-    judges = Judge.query.order_by(Judge.created_at.desc()).all()
-    return jsonify([{
+    return cached_json("judges", lambda: [{
         "id": j.id,
         "name": j.name,
         "prompt": j.prompt,
         "modelName": j.model_name,
         "active": j.active,
         "createdAt": j.created_at.isoformat()
-    } for j in judges])
+    } for j in Judge.query.order_by(Judge.created_at.desc()).all()])
 
 
 @bp.post("")
@@ -42,6 +42,7 @@ def create_judge():
     )
     db.session.add(judge)
     db.session.commit()
+    bump("judges")
     return {"id": judge.id}, 201
 
 
@@ -65,6 +66,7 @@ def update_judge(judge_id: int):
     judge.active = data.get("active", judge.active)
 
     db.session.commit()
+    bump("judges")
     return {"ok": True}
 
 
@@ -76,4 +78,6 @@ def delete_judge(judge_id: int):
 
     db.session.delete(judge)
     db.session.commit()
+    # Deleting a judge cascades to its assignments
+    bump("judges", "assignments")
     return {"ok": True}
@@ -1,5 +1,6 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
 from database import db
+from cache import bump, cached_json
 from models import Submission
 
 bp = Blueprint("submissions", __name__, url_prefix="/submissions")
@@ -25,6 +26,8 @@ def import_submissions():
             count += 1
 
         db.session.commit()
+        # Replaced submissions cascade to their assignments and evaluations
+        bump("submissions", "assignments", "evaluations")
         return {"status": "ok", "imported": count}
     except Exception as e:
         db.session.rollback()
@@ -33,11 +36,10 @@ def import_submissions():
 
 @bp.get("")
 def list_submissions():
-    subs = Submission.query.all()
-    return jsonify([
+    return cached_json("submissions", lambda: [
         {"id": s.id, "queueId": s.queue_id,
             "taskId": s.task_id, "createdAt": s.created_at}
-        for s in subs
+        for s in Submission.query.all()
     ])
 
 
@@ -50,6 +52,7 @@ def clear_all_submissions():
         for submission in Submission.query.all():
             db.session.delete(submission)
         db.session.commit()
+        bump("submissions", "assignments", "evaluations")
         return {"status": "ok", "deleted": count}
     except Exception as e:
         db.session.rollback()
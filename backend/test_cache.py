@@ -0,0 +1,171 @@
+import os
+
+import pytest
+
+# app.py reads these at import time; llm.py needs a key to build its client
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import cache  # noqa: E402
+from app import app, initialize_app  # noqa: E402
+from database import db  # noqa: E402
+
+initialize_app()
+
+
+sample_payload = [
+    {
+        "id": "sub_1",
+        "queueId": "queue_1",
+        "labelingTaskId": "task_1",
+        "createdAt": 1690000000000,
+        "questions": [
+            {
+                "rev": 1,
+                "data": {
+                    "id": "q_template_1",
+                    "questionType": "single_choice_with_reasoning",
+                    "questionText": "Is the sky blue?"
+                }
+            }
+        ],
+        "answers": {
+            "q_template_1": {
+                "choice": "yes",
+                "reasoning": "Observed on a clear day."
+            }
+        }
+    }
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(
+        "routes.evaluations.evaluate",
+        lambda *args: {"verdict": "pass", "reasoning": "ok"})
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    cache._entries.clear()
+    return app.test_client()
+
+
+@pytest.fixture
+def seeded(client):
+    """Client with one submission, judge, assignment and evaluation."""
+    client.post("/submissions/import", json=sample_payload)
+    judge_id = client.post("/judges", json={"name": "j", "prompt": "p"}).json["id"]
+    client.post("/assignments", json={
+        "submissionId": "sub_1", "questionId": "q_template_1", "judgeId": judge_id})
+    assert client.post("/evaluations/run", json={}).json["completed"] == 1
+    return client
+
+
+def etag_of(client, url):
+    """GET url, check a revalidation with its ETag is a 304, return the ETag."""
+    r = client.get(url)
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+    again = client.get(url, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+    return etag
+
+
+def refetch(client, url, etag):
+    """Revalidate with a stale ETag; expect a full 200 with a new ETag."""
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+    return r.json
+
+
+@pytest.mark.parametrize("url", ["/judges", "/submissions", "/assignments", "/evaluations"])
+def test_repeat_get_is_not_modified(seeded, url):
+    etag_of(seeded, url)
+
+
+def test_submission_import_invalidates_cascades(seeded):
+    subs = etag_of(seeded, "/submissions")
+    assignments = etag_of(seeded, "/assignments")
+    evals = etag_of(seeded, "/evaluations")
+
+    # Re-importing replaces sub_1, cascading to its assignments and evaluations
+    replaced = [dict(sample_payload[0], queueId="queue_2")]
+    seeded.post("/submissions/import", json=replaced)
+
+    assert refetch(seeded, "/submissions", subs)[0]["queueId"] == "queue_2"
+    assert refetch(seeded, "/assignments", assignments) == []
+    assert refetch(seeded, "/evaluations", evals)["summary"]["total"] == 0
+
+
+def test_submission_clear_invalidates_cascades(seeded):
+    subs = etag_of(seeded, "/submissions")
+    assignments = etag_of(seeded, "/assignments")
+    evals = etag_of(seeded, "/evaluations")
+
+    seeded.delete("/submissions/clear")
+
+    assert refetch(seeded, "/submissions", subs) == []
+    assert refetch(seeded, "/assignments", assignments) == []
+    assert refetch(seeded, "/evaluations", evals)["summary"]["total"] == 0
+
+
+def test_judge_create_and_update_invalidate(client):
+    etag = etag_of(client, "/judges")
+    judge_id = client.post("/judges", json={"name": "a", "prompt": "p"}).json["id"]
+    assert [j["name"] for j in refetch(client, "/judges", etag)] == ["a"]
+
+    etag = etag_of(client, "/judges")
+    client.put(f"/judges/{judge_id}", json={"name": "b"})
+    assert [j["name"] for j in refetch(client, "/judges", etag)] == ["b"]
+
+
+def test_judge_delete_invalidates_assignments(seeded):
+    judges = etag_of(seeded, "/judges")
+    assignments = etag_of(seeded, "/assignments")
+
+    seeded.delete("/judges/1")
+
+    assert refetch(seeded, "/judges", judges) == []
+    assert refetch(seeded, "/assignments", assignments) == []
+
+
+def test_assignment_writes_invalidate(client):
+    client.post("/submissions/import", json=sample_payload)
+    client.post("/judges", json={"name": "j", "prompt": "p"})
+
+    etag = etag_of(client, "/assignments")
+    client.post("/assignments", json={
+        "submissionId": "sub_1", "questionId": "q_template_1", "judgeId": 1})
+    assert len(refetch(client, "/assignments", etag)) == 1
+
+    etag = etag_of(client, "/assignments")
+    client.delete("/assignments/clear")
+    assert refetch(client, "/assignments", etag) == []
+
+
+def test_evaluation_writes_invalidate(seeded):
+    etag = etag_of(seeded, "/evaluations")
+    seeded.post("/evaluations/run", json={})
+    assert refetch(seeded, "/evaluations", etag)["summary"]["total"] == 2
+
+    etag = etag_of(seeded, "/evaluations")
+    seeded.delete("/evaluations/clear")
+    assert refetch(seeded, "/evaluations", etag)["summary"]["total"] == 0
+
+
+def test_filtered_evaluations_do_not_share_cache_entries(seeded):
+    filtered = seeded.get("/evaluations?judgeId=1&verdict=pass")
+    assert filtered.json["summary"]["total"] == 1
+
+    # Arg order doesn't matter
+    reordered = seeded.get("/evaluations?verdict=pass&judgeId=1",
+                           headers={"If-None-Match": filtered.headers["ETag"]})
+    assert reordered.status_code == 304
+
+    # A single judgeId arg that merely looks like both filters is a different query
+    encoded = seeded.get("/evaluations?judgeId=1%26verdict%3Dpass")
+    assert encoded.status_code == 200
+    assert encoded.json["summary"]["total"] == 0